@@ -1,10 +1,20 @@
-from typing import List, Any
+import functools
+import threading
+from typing import List, Any, Optional
+
+import yaml
 from crewai import Agent, Task, Crew, Process
 from crewai.project import CrewBase, agent, crew, task
 from agent.models import PlannerOutput, GeneratorOutput
 
 from agent.llm import deepseek_llm
 
+@functools.cache
+def _load_yaml(path: str) -> dict:
+    """Parses a config file once per process and reuses the dict afterwards."""
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
 
 @CrewBase
 class TreeSearchCrew:
@@ -15,6 +25,17 @@ class TreeSearchCrew:
     agents: List[Agent]
     tasks: List[Task]
 
+    _planning_crew: Optional[Crew] = None
+    _generation_crew: Optional[Crew] = None
+    _crew_init_lock = threading.Lock()
+
+    @staticmethod
+    def load_yaml(config_path):
+        # Overrides the loader CrewBase injects, whose load_configurations()
+        # re-reads both YAML files on every instantiation; routing it through
+        # the cached parser makes that a dict lookup after the first crew.
+        return _load_yaml(str(config_path))
+
     @agent
     def planner(self) -> Agent:
         return Agent(
@@ -89,22 +110,53 @@ class TreeSearchCrew:
             memory=True
         )
 
-    def run_planning(self, inputs: dict) -> Any:
-        """Runs only the Planning step."""
-        crew = Crew(
-            agents=[self.planner()],
-            tasks=[self.planning_task()],
+    def _build_planning_crew(self) -> Crew:
+        # Constructed inline rather than via self.planner()/self.planning_task():
+        # the @agent/@task decorators memoize per instance, so the accessors
+        # would hand every "fresh" crew the same shared Agent/Task objects.
+        return Crew(
+            agents=[Agent(config=self.agents_config['planner'], llm=deepseek_llm)],
+            tasks=[Task(config=self.tasks_config['planning_task'],
+                        output_pydantic=PlannerOutput)],
+            verbose=True
+        )
+
+    def _build_generation_crew(self) -> Crew:
+        return Crew(
+            agents=[Agent(config=self.agents_config['generator'], llm=deepseek_llm)],
+            tasks=[Task(config=self.tasks_config['generation_task'],
+                        output_pydantic=GeneratorOutput)],
             verbose=True
         )
-        result = crew.kickoff(inputs=inputs)
+
+    def run_planning(self, inputs: dict) -> Any:
+        """Runs only the Planning step."""
+        if self._planning_crew is None:
+            with self._crew_init_lock:
+                if self._planning_crew is None:
+                    self._planning_crew = self._build_planning_crew()
+        result = self._planning_crew.kickoff(inputs=inputs)
         return result
 
+    def run_planning_isolated(self, inputs: dict) -> Any:
+        """
+        Runs the Planning step on a throwaway crew.
+
+        kickoff interpolates inputs into the Task/Agent objects in place,
+        so concurrent callers must not share a Crew instance; building one
+        per call is cheap next to the LLM round-trip.
+        """
+        return self._build_planning_crew().kickoff(inputs=inputs)
+
     def run_generation(self, inputs: dict) -> Any:
         """Runs only the Generation step."""
-        crew = Crew(
-            agents=[self.generator()],
-            tasks=[self.generation_task()],
-            verbose=True
-        )
-        result = crew.kickoff(inputs=inputs)
-        return result
\ No newline at end of file
+        if self._generation_crew is None:
+            with self._crew_init_lock:
+                if self._generation_crew is None:
+                    self._generation_crew = self._build_generation_crew()
+        result = self._generation_crew.kickoff(inputs=inputs)
+        return result
+
+    def run_generation_isolated(self, inputs: dict) -> Any:
+        """Runs the Generation step on a throwaway crew (see run_planning_isolated)."""
+        return self._build_generation_crew().kickoff(inputs=inputs)
\ No newline at end of file
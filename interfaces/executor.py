@@ -17,3 +17,13 @@ class IExecutor(ABC):
         Executes the given test code and returns feedback.
         """
         pass
+
+    def execute_tests(self, test_codes: List[str]) -> List[ExecutionFeedback]:
+        """
+        Executes a batch of candidate tests and returns per-test feedback.
+
+        Default implementation falls back to one execute_test call per
+        candidate; backends with a native batch endpoint should override
+        this to collapse the N round-trips into one.
+        """
+        return [self.execute_test(code) for code in test_codes]
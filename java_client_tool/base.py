@@ -1,23 +1,63 @@
+import asyncio
+import weakref
+
 import httpx
+import orjson
+
+
+def _deferred_aclose(client: httpx.AsyncClient) -> None:
+    """Closes a leaked client pool when its owner is garbage-collected."""
+    try:
+        loop = asyncio.get_running_loop()
+        loop.create_task(client.aclose())
+    except RuntimeError:
+        asyncio.run(client.aclose())
+
 
 class JavaClient:
     def __init__(self, base_url="http://localhost:8080"):
         self.base_url = base_url
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            http2=True,
+            headers={"Accept-Encoding": "gzip"},
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=64,
+                max_connections=128,
+                keepalive_expiry=60
+            )
+        )
+        self._finalizer = weakref.finalize(self, _deferred_aclose, self._client)
 
     async def _get(self, path: str, params: dict = None):
-        async with httpx.AsyncClient() as client:
-            r = await client.get(f"{self.base_url}{path}", params=params)
+        r = await self._client.get(path, params=params)
+        if not r.is_success:
             r.raise_for_status()
-            return r.json()
+        return orjson.loads(r.content)
 
     async def get(self, path: str, params=None):
         return await self._get(path, params)
 
     async def _post(self, path: str, params: dict = None):
-        async with httpx.AsyncClient() as client:
-            r = await client.post(f"{self.base_url}{path}", json=params)
+        r = await self._client.post(
+            path,
+            content=orjson.dumps(params),
+            headers={"Content-Type": "application/json"}
+        )
+        if not r.is_success:
             r.raise_for_status()
-            return r.json()
+        return orjson.loads(r.content)
 
     async def post(self, path: str, params=None):
         return await self._post(path, params)
+
+    async def aclose(self):
+        self._finalizer.detach()
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
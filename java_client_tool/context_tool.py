@@ -1,19 +1,42 @@
+import asyncio
 import json
+from typing import Dict, List
 
 from .base import JavaClient
 
 class ContextTool(JavaClient):
+    def __init__(self, base_url="http://localhost:8080"):
+        super().__init__(base_url)
+        self._fm_ctx_cache: Dict[str, dict] = {}
+        self._search_cache: Dict[str, dict] = {}
+
     async def get_fm_ctx(self, function_path: str):
-        return await self.get(
+        cached = self._fm_ctx_cache.get(function_path)
+        if cached is not None:
+            return cached
+        ctx = await self.get(
             "/api/context/function-context",
             {"functionPath": function_path}
         )
+        self._fm_ctx_cache[function_path] = ctx
+        return ctx
+
+    async def get_fm_ctx_many(self, function_paths: List[str]):
+        """Fetches contexts for several functions concurrently."""
+        return await asyncio.gather(
+            *(self.get_fm_ctx(path) for path in function_paths)
+        )
 
     async def search_fm(self, query: str):
-        return await self.get(
+        cached = self._search_cache.get(query)
+        if cached is not None:
+            return cached
+        result = await self.get(
             "/api/context/search",
             {"q": query}
         )
+        self._search_cache[query] = result
+        return result
 
 
 if __name__ == '__main__':
@@ -21,25 +44,24 @@ if __name__ == '__main__':
 
 
     async def main():
-        client = ContextTool()
-
-        fm = await client.search_fm("_setComment")
+        async with ContextTool() as client:
+            fm = await client.search_fm("_setComment")
 
-        if not fm or not fm.get("success"):
-            print("Search failed")
-            return
+            if not fm or not fm.get("success"):
+                print("Search failed")
+                return
 
-        results = fm.get("results", [])
-        if not results:
-            print("No functions found")
-            return
+            results = fm.get("results", [])
+            if not results:
+                print("No functions found")
+                return
 
-        first = results[0]
-        path = first["path"]
+            first = results[0]
+            path = first["path"]
 
-        ctx = await client.get_fm_ctx(path)
+            ctx = await client.get_fm_ctx(path)
 
-        print(json.dumps(ctx, indent=2))
+            print(json.dumps(ctx, indent=2))
 
 
     asyncio.run(main())
\ No newline at end of file
@@ -2,48 +2,68 @@ from typing import List, Set, Optional, Dict
 from models.node import Node
 from interfaces.strategy import IStrategy
 import heapq
+import itertools
+
+
+def _mask_from_ids(ids) -> int:
+    """Packs an iterable of MC/DC condition ids into a single int bitmask."""
+    mask = 0
+    for i in ids:
+        mask |= 1 << i
+    return mask
+
 
 class GreedyStrategy(IStrategy):
     def __init__(self, foundation_node: Node):
         self.root = foundation_node
-        self.cumulative_covered_ids: Set[int] = set()
-        
+        self.cumulative_covered_mask: int = 0
+
         if self.root.covered_mcdc_ids:
-            self.cumulative_covered_ids.update(self.root.covered_mcdc_ids)
+            self.cumulative_covered_mask = self.root.covered_mcdc_ids
             self.root.is_retained = True
 
         self.candidate_queue: List[tuple] = []
-        
+        self._push_counter = itertools.count()
+
     def add_node(self, node: Node) -> None:
         """
         Add a node to the queue to be considered for expansion.
         """
-        heapq.heappush(self.candidate_queue, (-node.score, node))
+        heapq.heappush(
+            self.candidate_queue,
+            (-node.score, next(self._push_counter), node)
+        )
 
     def select_next_node(self) -> Optional[Node]:
         """
-        Selects the best node from the queue.
+        Selects the best node from the queue, skipping stale entries.
         """
-        if not self.candidate_queue:
-            return None
-            
-        _, best_node = heapq.heappop(self.candidate_queue)
-        return best_node
+        while self.candidate_queue:
+            neg_score, _, best_node = heapq.heappop(self.candidate_queue)
+            if -neg_score != best_node.score:
+                # The node was re-scored (and re-pushed) after this entry
+                # was queued; drop the outdated entry lazily.
+                continue
+            return best_node
+        return None
 
     def update_node(self, node: Node, covered_ids: Set[int]) -> None:
         """
          Updates a node with new execution results (MCDC feedback).
          Calculates the score based on GLOBAL cumulative coverage.
         """
-        node.covered_mcdc_ids = covered_ids
-        
-        new_items = covered_ids - self.cumulative_covered_ids
-        
-        node.score = len(new_items)
-        
+        covered_mask = _mask_from_ids(covered_ids)
+        node.covered_mcdc_ids = covered_mask
+
+        new_mask = covered_mask & ~self.cumulative_covered_mask
+
+        node.score = new_mask.bit_count()
+
         if node.score > 0:
-            self.cumulative_covered_ids.update(new_items)
+            self.cumulative_covered_mask |= new_mask
             node.is_retained = True
             self.add_node(node)
-        else:
-            pass
+
+    def get_coverage_count(self) -> int:
+        """Number of distinct MC/DC condition ids covered so far."""
+        return self.cumulative_covered_mask.bit_count()
@@ -1,42 +1,112 @@
+import heapq
+import sys
 from typing import List, Optional, Set, Any
 
 class Node:
+    __slots__ = (
+        'children',
+        'focal_method',
+        'current_coverage',
+        'score',
+        'depth',
+        'driver_delta',
+        'parent',
+        'covered_mcdc_ids',
+        'is_retained',
+    )
+
     def __init__(
             self,
             focal_method: str,
             current_coverage: float,
-            test_drivers: Optional[List[str]] = None,
+            driver_delta: Optional[str] = None,
             parent: Optional['Node'] = None):
 
-        self.children: List[Node] = []
-        self.focal_method: str = focal_method
+        # Min-heap of (-score, id(child), child) so the best child is an
+        # O(1) peek instead of an O(k) max() scan per selection step.
+        self.children: List[tuple] = []
+        # The focal method is shared by every node in a tree; interning
+        # keeps a single string object instead of one copy per node.
+        self.focal_method: str = sys.intern(focal_method)
         self.current_coverage: float = current_coverage
         self.score: float = 0.0
         self.depth: int = 0
         if parent is not None:
             self.depth = parent.depth + 1
-        self.test_drivers: List[str] = test_drivers if test_drivers is not None else []
+        # Only the driver added at this node is stored; the full suite is
+        # the chain of deltas up to the root (see get_test_drivers).
+        self.driver_delta: Optional[str] = driver_delta
         self.parent: Optional[Node] = parent
-        self.covered_mcdc_ids: Set[int] = set()
+        # Bitmask over MC/DC condition ids: bit i set means id i is covered.
+        self.covered_mcdc_ids: int = 0
         self.is_retained: bool = False
 
+    def iter_drivers(self):
+        """Yields this node's driver chain in leaf-to-root order."""
+        node = self
+        while node is not None:
+            if node.driver_delta:
+                yield node.driver_delta
+            node = node.parent
+
+    def get_test_drivers(self) -> List[str]:
+        """Materializes the full driver list in root-to-leaf order."""
+        drivers = list(self.iter_drivers())
+        drivers.reverse()
+        return drivers
+
+    def add_covered_id(self, condition_id: int) -> None:
+        self.covered_mcdc_ids |= 1 << condition_id
+
+    def covered_count(self) -> int:
+        return self.covered_mcdc_ids.bit_count()
+
     def add_child(self, child_node: 'Node') -> None:
-        self.children.append(child_node)
+        heapq.heappush(self.children, (-child_node.score, id(child_node), child_node))
 
     def remove_child(self, child_node: 'Node') -> None:
-        if child_node in self.children:
-            self.children.remove(child_node)
+        remaining = [entry for entry in self.children if entry[2] is not child_node]
+        if len(remaining) != len(self.children):
+            heapq.heapify(remaining)
+            self.children = remaining
 
     def get_children(self) -> List['Node']:
-        return self.children
+        return [entry[2] for entry in self.children]
 
     def expand(self, num_children: int = 3) -> None:
         pass
 
+    def resort_children(self) -> None:
+        """Restores the heap invariant after child scores were updated."""
+        self.children = [(-child.score, id(child), child)
+                         for _, _, child in self.children]
+        heapq.heapify(self.children)
+
     def best_child(self) -> Optional['Node']:
         if not self.children:
             return None
-        return max(self.children, key=lambda child: child.score)
+        return self.children[0][2]
+
+    def flatten(self) -> 'Node':
+        """
+        Returns a detached copy of this node for reuse in a later search.
+
+        The subtree is dropped and its knowledge is summarized: the copy's
+        score is the mean of the children's scores (or this node's own
+        score for a leaf), and the covered-id mask is carried over.
+        """
+        copy = Node(
+            focal_method=self.focal_method,
+            current_coverage=self.current_coverage,
+            driver_delta=self.driver_delta
+        )
+        children = self.get_children()
+        if children:
+            copy.score = sum(child.score for child in children) / len(children)
+        else:
+            copy.score = self.score
+        copy.covered_mcdc_ids = self.covered_mcdc_ids
+        return copy
 
     def is_terminal(self) -> bool:
         return len(self.children) == 0
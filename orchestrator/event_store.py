@@ -1,9 +1,25 @@
+import atexit
 import json
 import logging
+import time
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from domain.events import Event
 
+try:
+    import orjson
+
+    def _dumps(obj: dict) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: dict) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,10 +33,15 @@ class EventStore:
     - Line-by-line replay
     """
     
+    # Flush the write buffer after this many pending events ...
+    FLUSH_EVERY = 64
+    # ... or once this many seconds have passed since the last flush.
+    FLUSH_INTERVAL = 0.25
+
     def __init__(self, session_id: str, log_dir: str = "logs"):
         """
         Initialize event store for a search session.
-        
+
         Args:
             session_id: Unique identifier for this search session
             log_dir: Base directory for logs (default: "logs")
@@ -28,83 +49,159 @@ class EventStore:
         self.session_id = session_id
         self.log_dir = Path(log_dir) / session_id
         self.log_dir.mkdir(parents=True, exist_ok=True)
-        
+
         self.log_file = self.log_dir / "events.jsonl"
+
+        # Event count is tracked incrementally; seed it from any log left
+        # by a previous run with one newline scan (memchr-fast in C).
+        self._count = 0
+        if self.log_file.exists():
+            with open(self.log_file, 'rb') as f:
+                self._count = f.read().count(b'\n')
+
+        self._fh = open(self.log_file, 'ab', buffering=1 << 16)
+        self._buf: List[bytes] = []
+        self._last_flush = time.monotonic()
+        atexit.register(self.close)
+
+        # In-memory mirror of the log plus an event_type -> indices map so
+        # repeated queries don't re-read and re-parse the file.
+        self._events: List[dict] = []
+        self._by_type: Dict[str, List[int]] = defaultdict(list)
+        self._loaded = False
+
         logger.info(f"EventStore initialized: {self.log_file}")
-    
+
     def record(self, event: Event) -> None:
         """
         Append an event to the log.
-        
+
+        Writes are buffered and flushed in batches so bursty logging does
+        not pay one open/write/close syscall round per event.
+
         Args:
             event: Event instance to persist
         """
         try:
             event_dict = event.to_dict()
-            
-            with open(self.log_file, 'a') as f:
-                f.write(json.dumps(event_dict) + '\n')
-            
+
+            self._buf.append(_dumps(event_dict) + b'\n')
+            if (len(self._buf) >= self.FLUSH_EVERY
+                    or time.monotonic() - self._last_flush > self.FLUSH_INTERVAL):
+                self.flush()
+
+            if self._loaded:
+                self._by_type[event_dict.get("event_type")].append(len(self._events))
+                self._events.append(event_dict)
+            self._count += 1
+
             logger.debug(f"Recorded event: {event.event_type}")
-        
+
         except Exception as e:
             logger.error(f"Failed to record event: {e}")
             raise
-    
-    def replay(self) -> List[dict]:
-        """
-        Replay all events from the log.
-        
-        Returns:
-            List of event dictionaries in chronological order
-        """
-        events = []
-        
+
+    def flush(self) -> None:
+        """Write any buffered events through to the log file."""
+        if self._buf:
+            self._fh.write(b''.join(self._buf))
+            self._buf.clear()
+        self._fh.flush()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush pending events and close the underlying file handle."""
+        if self._fh.closed:
+            return
+        self.flush()
+        self._fh.close()
+
+    def _ensure_loaded(self) -> None:
+        """Stream the log file into the in-memory cache once."""
+        if self._loaded:
+            return
+
+        self.flush()
         if not self.log_file.exists():
             logger.warning(f"Log file does not exist: {self.log_file}")
-            return events
-        
+            self._loaded = True
+            return
+
         try:
-            with open(self.log_file, 'r') as f:
+            with open(self.log_file, 'rb') as f:
                 for line_num, line in enumerate(f, start=1):
                     line = line.strip()
                     if not line:
                         continue
-                    
+
                     try:
-                        event_dict = json.loads(line)
-                        events.append(event_dict)
-                    except json.JSONDecodeError as e:
+                        event_dict = _loads(line)
+                    except ValueError as e:
                         logger.error(f"Malformed JSON at line {line_num}: {e}")
                         continue
-            
-            logger.info(f"Replayed {len(events)} events from {self.log_file}")
-            return events
-        
+
+                    self._by_type[event_dict.get("event_type")].append(len(self._events))
+                    self._events.append(event_dict)
+
+            self._loaded = True
+            logger.info(f"Replayed {len(self._events)} events from {self.log_file}")
+
         except Exception as e:
             logger.error(f"Failed to replay events: {e}")
             raise
-    
+
+    def iter_events(self) -> Iterator[dict]:
+        """
+        Stream events one at a time in chronological order.
+
+        Serves from the in-memory cache when populated; otherwise reads
+        the log lazily so large sessions replay in constant memory.
+        """
+        if self._loaded:
+            yield from self._events
+            return
+
+        self.flush()
+        if not self.log_file.exists():
+            return
+
+        with open(self.log_file, 'rb') as f:
+            for line_num, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+
+                try:
+                    yield _loads(line)
+                except ValueError as e:
+                    logger.error(f"Malformed JSON at line {line_num}: {e}")
+
+    def replay(self) -> List[dict]:
+        """
+        Replay all events from the log.
+
+        Returns:
+            List of event dictionaries in chronological order
+        """
+        self._ensure_loaded()
+        return list(self._events)
+
     def get_events_by_type(self, event_type: str) -> List[dict]:
         """
         Replay events filtered by type.
-        
+
         Args:
             event_type: Event type to filter (e.g., "CoverageGained")
-        
+
         Returns:
             List of events matching the type
         """
-        all_events = self.replay()
-        return [e for e in all_events if e.get("event_type") == event_type]
+        self._ensure_loaded()
+        return [self._events[i] for i in self._by_type.get(event_type, ())]
     
     def get_event_count(self) -> int:
         """Get total number of events in the log."""
-        if not self.log_file.exists():
-            return 0
-        
-        with open(self.log_file, 'r') as f:
-            return sum(1 for line in f if line.strip())
+        return self._count
     
     def clear(self) -> None:
         """
@@ -112,6 +209,14 @@ class EventStore:
         
         This is primarily for testing. Production code should append-only.
         """
+        self._buf.clear()
+        self._fh.close()
         if self.log_file.exists():
             self.log_file.unlink()
             logger.warning(f"Cleared event log: {self.log_file}")
+        self._fh = open(self.log_file, 'ab', buffering=1 << 16)
+        self._last_flush = time.monotonic()
+        self._events.clear()
+        self._by_type.clear()
+        self._loaded = True
+        self._count = 0
@@ -1,4 +1,4 @@
-from typing import Tuple, Set
+from typing import Tuple
 from logic.greedy_strategy import GreedyStrategy
 
 
@@ -12,55 +12,65 @@ class SearchTerminator:
     3. Queue exhausted (no more candidates with new coverage)
     """
     
-    def __init__(self, max_iterations: int = 100):
+    def __init__(self, all_paths_mask: int, max_iterations: int = 100):
         """
         Initialize terminator.
-        
+
         Args:
+            all_paths_mask: Bitmask of all possible condition path ids;
+                fixed for a given function, so it is taken once here
             max_iterations: Maximum search iterations allowed
         """
         self.max_iterations = max_iterations
-    
+        self.all_paths_mask = all_paths_mask
+        self._n_total = all_paths_mask.bit_count()
+
     def should_terminate(
         self,
         iteration: int,
-        strategy: GreedyStrategy,
-        all_possible_paths: Set[str]
+        strategy: GreedyStrategy
     ) -> Tuple[bool, str]:
         """
         Check if search should terminate.
-        
+
         Args:
             iteration: Current iteration number (1-indexed)
             strategy: GreedyStrategy instance with current coverage state
-            all_possible_paths: All possible condition paths for the function
-        
+
         Returns:
             (should_stop, reason): Boolean and reason string
         """
+        # Fast path: no criterion fires, so skip the percentage math and
+        # reason-string construction that only matter on termination.
+        if (iteration < self.max_iterations
+                and strategy.candidate_queue
+                and (self.all_paths_mask & ~strategy.cumulative_covered_mask) != 0):
+            return False, ""
+
+        total = self._n_total
+
         # Criterion 1: Max iterations reached
         if iteration >= self.max_iterations:
             coverage_pct = self._calculate_coverage_percentage(
                 strategy.get_coverage_count(),
-                len(all_possible_paths)
+                total
             )
             return True, (
                 f"Max iterations ({self.max_iterations}) reached. "
                 f"Final coverage: {coverage_pct:.1f}% "
-                f"({strategy.get_coverage_count()}/{len(all_possible_paths)} paths)"
+                f"({strategy.get_coverage_count()}/{total} paths)"
             )
-        
+
        # Criterion 2: All paths covered
-        if strategy.global_visited_paths >= all_possible_paths:
+        if (self.all_paths_mask & ~strategy.cumulative_covered_mask) == 0:
             return True, (
-                f"Full coverage achieved! All {len(all_possible_paths)} "
+                f"Full coverage achieved! All {total} "
                 f"condition paths covered in {iteration} iterations."
             )
-        
+
         # Criterion 3: Queue empty (no more candidates)
         if not strategy.candidate_queue:
             covered = strategy.get_coverage_count()
-            total = len(all_possible_paths)
             uncovered = total - covered
             coverage_pct = self._calculate_coverage_percentage(covered, total)
             
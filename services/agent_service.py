@@ -1,42 +1,127 @@
+import asyncio
+import hashlib
 import json
+import logging
+import threading
+from collections import OrderedDict
 from typing import List, Dict, Optional
+
+import orjson
+
 from models.node import Node
 from agent.TreeSearchCrew import TreeSearchCrew
 
+logger = logging.getLogger(__name__)
+
+_LLM_CACHE_MAX = 512
+
+
+def _llm_cache_key(*parts) -> bytes:
+    """Stable 128-bit fingerprint over a mix of strings and JSON-able parts."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode() if isinstance(part, str) else orjson.dumps(part))
+        h.update(b'\0')
+    return h.digest()
+
+
 class AgentService:
     def __init__(self):
         self.crew_runner = TreeSearchCrew()
+        # Transposition table: digest of (focal method, driver chain,
+        # uncovered targets) -> child previously generated for that exact
+        # state, reusable across searches.
+        self._transposition: Dict[bytes, Node] = {}
+        # LRU caches over LLM call inputs: identical planning/generation
+        # requests (common when MCTS revisits sibling subtrees) skip the
+        # network round-trip entirely.
+        self._plan_cache: OrderedDict = OrderedDict()
+        self._code_cache: OrderedDict = OrderedDict()
+        # Batch expansion hits the caches from several worker threads;
+        # lookup-then-move_to_end must not race a concurrent eviction.
+        self._cache_lock = threading.Lock()
+
+    def _cache_get(self, cache: OrderedDict, key: bytes):
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, cache: OrderedDict, key: bytes, value) -> None:
+        with self._cache_lock:
+            cache[key] = value
+            if len(cache) > _LLM_CACHE_MAX:
+                cache.popitem(last=False)
+
+    def plan_expansion(self, uncovered_conditions: List[dict], function_code: str,
+                       isolated: bool = False) -> Optional[Dict]:
+        cache_key = _llm_cache_key(uncovered_conditions, function_code)
+        cached = self._cache_get(self._plan_cache, cache_key)
+        if cached is not None:
+            return cached
 
-    def plan_expansion(self, uncovered_conditions: List[dict], function_code: str) -> Optional[Dict]:
         inputs = {
             "uncovered_conditions": json.dumps(uncovered_conditions, indent=2),
             "function_code": function_code
         }
-        crew_result = self.crew_runner.run_planning(inputs)
-        
+        # Concurrent callers must use a throwaway crew: kickoff mutates
+        # the shared Task/Agent objects in place.
+        runner = (self.crew_runner.run_planning_isolated if isolated
+                  else self.crew_runner.run_planning)
+        crew_result = runner(inputs)
+
         if hasattr(crew_result, 'pydantic') and crew_result.pydantic:
-             return crew_result.pydantic.model_dump()
-        
-        print(f"Error: No Pydantic output in result: {crew_result}")
+             plan = crew_result.pydantic.model_dump()
+             self._cache_put(self._plan_cache, cache_key, plan)
+             return plan
+
+        logger.error(f"No Pydantic output in planner result: {crew_result}")
         return None
 
-    def generate_code(self, target_goal: Dict, function_code: str, function_signature: str) -> Optional[str]:
+    def generate_code(self, target_goal: Dict, function_code: str, function_signature: str,
+                      isolated: bool = False) -> Optional[str]:
+        cache_key = _llm_cache_key(target_goal, function_code, function_signature)
+        cached = self._cache_get(self._code_cache, cache_key)
+        if cached is not None:
+            return cached
+
         inputs = {
             "target_goal": json.dumps(target_goal),
             "function_signature": function_signature,
             "function_code": function_code
         }
-        crew_result = self.crew_runner.run_generation(inputs)
-        
+        runner = (self.crew_runner.run_generation_isolated if isolated
+                  else self.crew_runner.run_generation)
+        crew_result = runner(inputs)
+
         if hasattr(crew_result, 'pydantic') and crew_result.pydantic:
-             return crew_result.pydantic.test_code
-             
-        print(f"Error: No Pydantic output in generator result: {crew_result}")
+             test_code = crew_result.pydantic.test_code
+             self._cache_put(self._code_cache, cache_key, test_code)
+             return test_code
+
+        logger.error(f"No Pydantic output in generator result: {crew_result}")
         return None
 
     def generate_candidates(self, node: Node, uncovered: List[dict], context: Dict) -> List[Node]:
         candidates = []
 
+        # A node expanded from the same driver chain *against the same
+        # uncovered targets* can reuse the prior result instead of paying
+        # the planning + generation LLM calls. The uncovered set must be
+        # part of the key: retained nodes are re-queued and re-expanded
+        # with a shrunken set, and those expansions need fresh plans.
+        state_key = _llm_cache_key(
+            node.focal_method, list(node.iter_drivers()), uncovered
+        )
+        known = self._transposition.get(state_key)
+        if known is not None:
+            reused = known.flatten()
+            reused.parent = node
+            reused.depth = node.depth + 1
+            candidates.append(reused)
+            return candidates
+
         target = self.plan_expansion(uncovered, context.get("function_code", ""))
         if not target:
             return []
@@ -48,13 +133,49 @@ class AgentService:
         )
 
         if code:
-             new_drivers = node.test_drivers + [code]
              child = Node(
                  focal_method=node.focal_method,
                  current_coverage=node.current_coverage,
-                 test_drivers=new_drivers,
+                 driver_delta=code,
                  parent=node
              )
+             self._transposition[state_key] = child
              candidates.append(child)
 
         return candidates
+
+    async def _expand_one(self, node: Node, uncovered: List[dict], context: Dict) -> Optional[Node]:
+        """Plans and generates one child without blocking the event loop."""
+        target = await asyncio.to_thread(
+            self.plan_expansion, uncovered, context.get("function_code", ""),
+            isolated=True
+        )
+        if not target:
+            return None
+
+        code = await asyncio.to_thread(
+            self.generate_code,
+            target,
+            context.get("function_code", ""),
+            context.get("function_signature", ""),
+            isolated=True
+        )
+        if not code:
+            return None
+
+        return Node(
+            focal_method=node.focal_method,
+            current_coverage=node.current_coverage,
+            driver_delta=code,
+            parent=node
+        )
+
+    async def generate_candidates_batch(self, node: Node, uncovered_batches: List[List[dict]], context: Dict) -> List[Node]:
+        """
+        Expands several uncovered-condition batches concurrently, so N
+        children cost roughly one plan+generate round-trip of latency.
+        """
+        children = await asyncio.gather(
+            *(self._expand_one(node, batch, context) for batch in uncovered_batches)
+        )
+        return [child for child in children if child is not None]